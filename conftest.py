@@ -0,0 +1 @@
+# 저장소 최상위를 rootdir로 고정해 tests/에서 main, mini_xlsx를 import 할 수 있게 한다.
@@ -1,33 +1,57 @@
+import hashlib
+import json
 import os
+import queue
+import re
+import shutil
 import sys
+import threading
 import traceback
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
-from PIL import Image, ImageTk
+from PIL import ExifTags, Image, ImageFilter, ImageOps
 from tkinterdnd2 import DND_FILES, TkinterDnD
-from openpyxl import Workbook, load_workbook
+
+from mini_xlsx import MiniXlsx, UnsupportedWorkbookError, read_rows
+
+# JPEG/PNG 등 기본 이미지 플러그인을 시작할 때 미리 등록 (첫 사진 드롭 시 지연 방지)
+Image.preinit()
 
 BREEDS_FILE = "breeds.txt"
 EXCEL_FILE = "customer_data.xlsx"
 OUTPUT_ROOT = "고객사진"
+EXCEL_FLUSH_DELAY_MS = 2000
+EXCEL_RETRY_DELAY_MS = 30000
+WORKER_POLL_MS = 50
+THUMB_CACHE_DIR = ".thumb_cache"
+THUMB_CACHE_MAX_BYTES = 50 * 1024 * 1024
+IMAGE_HEADER_CACHE_SIZE = 16
+CUSTOMER_PLACEHOLDER = "010-0000-0000"
 
 
 # ---------- 공통 유틸 ----------
 
+# 숫자 이외의 문자 (str.isdigit 루프 대신 한 번의 C 호출로 처리)
+_NON_DIGIT_RE = re.compile(r"\D")
+# 고객번호에 허용되지 않는 문자 (숫자, '-', 공백 이외)
+_PHONE_INVALID_RE = re.compile(r"[^\d\- ]")
+
+
 def load_breeds_or_die(filename: str = BREEDS_FILE):
     """
     품종 리스트를 읽어오고, 실패하면 오류창을 띄우고 프로그램을 종료한다.
     """
     try:
-        breeds = []
-        with open(filename, "r", encoding="utf-8") as f:
-            for line in f:
-                name = line.strip()
-                if name:
-                    breeds.append(name)
+        # 한 번에 읽어서 디코딩 (utf-8-sig: 메모장 등에서 저장한 BOM 제거)
+        with open(filename, "rb") as f:
+            data = f.read()
+        lines = data.decode("utf-8-sig").splitlines()
+        breeds = [line.strip() for line in lines if line.strip()]
 
         # '기타(직접입력)' 없으면 자동 추가
         if "기타(직접입력)" not in breeds:
@@ -79,61 +103,354 @@ def load_breeds_or_die(filename: str = BREEDS_FILE):
         sys.exit(1)
 
 
+# 폴더/파일명 금지 문자 → "_"
+_PATH_TABLE = str.maketrans({ch: "_" for ch in '\\/:*?"<>|'})
+
+
 def sanitize_for_path(name: str) -> str:
     """폴더/파일명에 사용할 문자열에서 금지 문자를 제거."""
-    invalid = '\\/:*?"<>|'
-    result = "".join("_" if ch in invalid else ch for ch in name)
-    return result.strip()
+    return name.translate(_PATH_TABLE).strip()
+
+
+# ---------- 엑셀 기록 ----------
+
+EXCEL_SHEET_TITLE = "고객기록"
+EXCEL_HEADER = (
+    "기록시각",
+    "고객번호",
+    "보호자 이름",
+    "강아지 이름",
+    "품종",
+    "오늘 미용 스타일",
+    "고객 요구사항",
+    "미용 중 특이사항",
+    "애프터 케어",
+    "결제금액",
+    "결제상태",
+    "미용 전 사진파일명",
+    "미용 후 사진파일명",
+)
+
+
+_openpyxl = None
+
+
+def _load_openpyxl():
+    """openpyxl은 불러오는 데 시간이 걸리므로 필요할 때(서식 등이 있는 엑셀 파일) 한 번만 import 한다."""
+    global _openpyxl
+    if _openpyxl is None:
+        import openpyxl
+
+        _openpyxl = openpyxl
+    return _openpyxl
 
 
-def ensure_excel_file(path: str):
-    """엑셀 파일이 없으면 새로 만들고, 있으면 그대로 둔다."""
-    if not os.path.exists(path):
-        wb = Workbook()
+class ExcelLog:
+    """
+    고객 기록 엑셀 파일.
+
+    기존 행은 프로세스당 한 번만 읽어 MiniXlsx에 직렬화해 두고, 새 행만 추가로 직렬화한다.
+    저장할 때는 미리 만든 XML 조각을 이어 붙여 파일을 통째로 다시 쓴다.
+
+    사용자가 엑셀에서 시트/수식/서식/열 너비 등을 추가한 파일은 값만 다시 쓰면 그 내용이 사라지므로,
+    그때는 openpyxl로 파일을 열어 행만 덧붙이는 방식(느리지만 내용 보존)으로 처리한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._loaded = False
+        self._sheet = None  # None이면 openpyxl로 덧붙이는 방식
+        self._mtime = None
+        # 읽어 온 기존 파일을 처음 다시 쓰기 전에 .bak으로 한 번 보관
+        self._backup_pending = False
+        # load_pending이 읽지 못해 따로 둔 보관 파일 경로
+        self.pending_set_aside = None
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load(self):
+        """파일에서 모든 행을 읽어온다. 파일이 없으면 제목 행만 가진 상태로 시작."""
+        mtime = self._file_mtime()
+        self._loaded = True
+        self._mtime = mtime
+        self._backup_pending = mtime is not None
+        self._sheet = None
+
+        rows = []
+        if mtime is not None:
+            try:
+                rows = read_rows(self.path)
+            except UnsupportedWorkbookError:
+                # 값 이외의 내용이 있는 파일: MiniXlsx로 다시 쓰지 않고 openpyxl로 덧붙인다
+                return
+
+        sheet = MiniXlsx(EXCEL_SHEET_TITLE)
+        for row in rows or [EXCEL_HEADER]:
+            sheet.append(row)
+        self._sheet = sheet
+
+    def append(self, row):
+        self.append_rows([row])
+
+    def append_rows(self, rows):
+        """
+        여러 줄을 추가하고 한 번만 저장. 외부에서 파일이 바뀐 경우에만 다시 읽는다.
+        행 변환이나 저장에 실패하면 추가한 줄을 모두 되돌려서, 다시 시도해도 중복되지 않게 한다.
+        """
+        if not self._loaded or self._file_mtime() != self._mtime:
+            self._load()
+
+        if self._sheet is None:
+            self._append_preserving(rows)
+            return
+
+        count = len(self._sheet)
+        try:
+            for row in rows:
+                self._sheet.append(row)
+            self.save()
+        except BaseException:
+            self._sheet.truncate(count)
+            raise
+
+    def _append_preserving(self, rows):
+        """openpyxl로 파일 전체를 열어 행을 덧붙인다. (다른 시트, 수식, 서식, 열 너비 유지)"""
+        wb = _load_openpyxl().load_workbook(self.path)
         ws = wb.active
-        ws.title = "고객기록"
-        ws.append(
-            [
-                "기록시각",
-                "고객번호",
-                "보호자 이름",
-                "강아지 이름",
-                "품종",
-                "오늘 미용 스타일",
-                "고객 요구사항",
-                "미용 중 특이사항",
-                "애프터 케어",
-                "결제금액",
-                "결제상태",
-                "미용 전 사진파일명",
-                "미용 후 사진파일명",
-            ]
-        )
-        wb.save(path)
+        for row in rows:
+            ws.append(row)
+        self._write_atomically(wb.save)
+
+    @property
+    def pending_path(self):
+        return self.path + ".pending.json"
+
+    def save_pending(self, rows):
+        """
+        아직 엑셀에 쓰지 못한 행을 따로 보관한다.
+        프로그램이 갑자기 종료되어도 다음 실행 때 load_pending으로 이어서 기록할 수 있다.
+        """
+        tmp_path = self.pending_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump([list(row) for row in rows], f, ensure_ascii=False)
+        os.replace(tmp_path, self.pending_path)
+
+    def load_pending(self):
+        """
+        save_pending으로 보관한 행을 읽는다.
+        파일이 깨져 있거나 읽을 수 없으면 .corrupt로 이름을 바꿔 따로 두고 빈 목록을 반환한다.
+        (따로 둔 경로는 pending_set_aside, 이름을 바꾸지도 못했으면 원래 경로)
+        """
+        self.pending_set_aside = None
+        try:
+            with open(self.pending_path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+            if not isinstance(rows, list) or not all(isinstance(row, list) for row in rows):
+                raise ValueError("행 목록 형식이 아닙니다")
+            return [tuple(row) for row in rows]
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError):
+            corrupt_path = self.pending_path + ".corrupt"
+            try:
+                os.replace(self.pending_path, corrupt_path)
+            except OSError:
+                corrupt_path = self.pending_path
+            self.pending_set_aside = corrupt_path
+            return []
+
+    def clear_pending(self):
+        """
+        보관한 행을 지운다. 파일을 지울 수 없으면(백신 프로그램이 잡고 있는 경우 등)
+        빈 목록으로 덮어써서 다음 실행 때 같은 행이 다시 기록되지 않게 한다.
+        """
+        try:
+            os.remove(self.pending_path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            self.save_pending([])
+
+    def save(self):
+        self._write_atomically(self._sheet.save)
+
+    def _write_atomically(self, write):
+        """
+        write(임시 파일 경로)로 다 쓴 뒤 os.replace로 교체한다.
+        저장 도중 프로그램이 종료되어도 기존 엑셀 파일은 깨지지 않는다.
+        """
+        if self._backup_pending and os.path.exists(self.path):
+            shutil.copy2(self.path, self.path + ".bak")
+        self._backup_pending = False
+
+        tmp_path = self.path + ".tmp"
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._mtime = self._file_mtime()
 
 
-def append_excel_row(path: str, row):
-    ensure_excel_file(path)
-    wb = load_workbook(path)
-    ws = wb.active
-    ws.append(row)
-    wb.save(path)
+def apply_exif_orientation(im):
+    """
+    EXIF 회전 정보가 있으면 픽셀을 실제로 돌린 새 이미지를 반환하고, 없으면 그대로 반환.
+    """
+    if im.getexif().get(ExifTags.Base.Orientation, 1) == 1:
+        return im
+    return ImageOps.exif_transpose(im)
 
 
-def load_image_for_thumbnail(path, size=(320, 220)):
-    """PNG 투명도 포함 이미지를 썸네일용 ImageTk.PhotoImage로 변환."""
-    im = Image.open(path)
+def flatten_to_rgb(im):
+    """
+    투명도가 있으면 흰 배경에 합성하고, 그 외에는 RGB로 변환한 새 이미지를 반환.
+    알파 채널을 split()으로 따로 꺼내지 않고 원본을 그대로 마스크로 써서 큰 사진도 배경 한 장만 할당한다.
+    """
     if im.mode in ("RGBA", "LA"):
         bg = Image.new("RGB", im.size, (255, 255, 255))
-        alpha = im.split()[-1]
-        bg.paste(im, mask=alpha)
-        im = bg
-    else:
-        im = im.convert("RGB")
+        bg.paste(im, mask=im)
+        return bg
+    return im.convert("RGB")
+
+
+# 저장 시 그대로 복사할 수 있는지 판단하는 데 필요한 정보 (픽셀 디코딩 없이 헤더만으로 얻음)
+ImageHeader = namedtuple("ImageHeader", "format mode has_transparency orientation")
+
+_header_cache = OrderedDict()
+_header_cache_lock = threading.Lock()
 
-    thumb = im.copy()
-    thumb.thumbnail(size)
-    return ImageTk.PhotoImage(thumb)
+
+def _header_key(path):
+    return (os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+
+def _header_from_image(im):
+    """Image.open 직후(디코딩 전)의 이미지에서 헤더 정보를 뽑는다."""
+    return ImageHeader(
+        im.format,
+        im.mode,
+        "transparency" in im.info,
+        im.getexif().get(ExifTags.Base.Orientation, 1),
+    )
+
+
+def _remember_header(key, header):
+    with _header_cache_lock:
+        _header_cache[key] = header
+        _header_cache.move_to_end(key)
+        while len(_header_cache) > IMAGE_HEADER_CACHE_SIZE:
+            _header_cache.popitem(last=False)
+
+
+def read_image_header(path):
+    """
+    이미지 헤더 정보를 반환. (경로, 수정시각) 기준으로 최근 IMAGE_HEADER_CACHE_SIZE개를 보관한다.
+    썸네일을 만들 때 이미 기록해 두므로 보통은 파일을 다시 열지 않는다.
+    """
+    key = _header_key(path)
+    with _header_cache_lock:
+        header = _header_cache.get(key)
+        if header is not None:
+            _header_cache.move_to_end(key)
+            return header
+
+    with Image.open(path) as im:
+        header = _header_from_image(im)
+    _remember_header(key, header)
+    return header
+
+
+def clear_image_header_cache():
+    with _header_cache_lock:
+        _header_cache.clear()
+
+
+def _thumbnail_cache_dir():
+    return os.path.join(os.path.abspath(os.path.dirname(__file__)), THUMB_CACHE_DIR)
+
+
+def _thumbnail_cache_path(path, size):
+    """원본 경로/수정시각/썸네일 크기로 캐시 파일 위치를 정한다. (원본이 바뀌면 키도 바뀜)"""
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{size[0]}x{size[1]}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(_thumbnail_cache_dir(), f"{digest}.png")
+
+
+def _evict_thumbnail_cache(max_bytes=THUMB_CACHE_MAX_BYTES):
+    """캐시 폴더가 max_bytes를 넘으면 오래된 파일부터 지운다."""
+    entries = []
+    total = 0
+    with os.scandir(_thumbnail_cache_dir()) as it:
+        for entry in it:
+            if entry.is_file():
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+    if total <= max_bytes:
+        return
+
+    entries.sort()
+    for _, file_size, file_path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(file_path)
+            total -= file_size
+        except OSError:
+            pass
+
+
+def load_image_for_thumbnail(path, size=(320, 220)):
+    """
+    PNG 투명도 포함 이미지를 썸네일용 PIL 이미지로 변환.
+    작업 스레드에서 호출되므로 Tk 객체(PhotoImage)는 여기서 만들지 않는다.
+    한 번 만든 썸네일은 디스크 캐시에 저장해 두고, 같은 파일은 원본을 다시 디코딩하지 않는다.
+    """
+    cache_path = _thumbnail_cache_path(path, size)
+    if os.path.exists(cache_path):
+        try:
+            cached = Image.open(cache_path)
+            cached.load()
+            # 최근에 사용한 캐시가 늦게 지워지도록 수정시각 갱신
+            os.utime(cache_path)
+            # 저장할 때 쓸 헤더 정보만 미리 읽어 둔다 (디코딩 없음)
+            read_image_header(path)
+            return cached
+        except Exception:
+            # 깨진 캐시는 무시하고 새로 만든다
+            pass
+
+    im = Image.open(path)
+    # 같은 파일 핸들에서 헤더 정보를 기록해 두어 저장 시 다시 열지 않게 한다 (draft가 mode를 바꾸기 전에)
+    _remember_header(_header_key(path), _header_from_image(im))
+    # JPEG는 디코딩 단계에서 1/2, 1/4, 1/8로 줄여서 읽는다 (PNG 등은 영향 없음).
+    # 투명도 합성도 줄어든 해상도에서 하도록 가장 먼저 호출한다.
+    im.draft("RGB", size)
+    # 폰 사진의 EXIF 회전 정보 반영 (draft 이후라 줄어든 해상도로 회전)
+    im = apply_exif_orientation(im)
+    im = flatten_to_rgb(im)
+
+    # flatten_to_rgb 결과는 이미 새 이미지이므로 copy() 없이 바로 축소.
+    # 미리보기 크기에서는 LANCZOS와 차이가 거의 없으므로 빠른 BILINEAR + 가벼운 샤픈으로 충분하다.
+    im.thumbnail(size, Image.Resampling.BILINEAR)
+    im = im.filter(ImageFilter.SHARPEN)
+
+    # 캐시 저장 실패는 미리보기에 영향을 주지 않도록 무시
+    try:
+        os.makedirs(_thumbnail_cache_dir(), exist_ok=True)
+        im.save(cache_path, "PNG", optimize=False, compress_level=1)
+        _evict_thumbnail_cache()
+    except OSError:
+        pass
+    return im
 
 
 # ---------- 메인 앱 ----------
@@ -153,6 +470,7 @@ class DogPhotoTool(TkinterDnD.Tk):
         self.dog_name = tk.StringVar()
         self.owner_name = tk.StringVar()
         self.customer_raw = tk.StringVar()
+        self._placeholder_active = False  # 고객번호 칸에 안내 문구(회색)가 표시 중인지
         self.style_today = tk.StringVar()
 
         self.breed_var = tk.StringVar()
@@ -160,14 +478,35 @@ class DogPhotoTool(TkinterDnD.Tk):
 
         self.payment_display = tk.StringVar()
         self.payment_state = tk.StringVar(value="paid")  # "paid" / "pending"
+        self._payment_last = None  # 마지막으로 정리(콤마 포맷)한 결제금액 문자열
 
         self.before_thumb = None
         self.after_thumb = None
 
+        # 썸네일 디코딩은 작업 스레드에서 (미용 전/후 사진을 동시에 처리)
+        self._thumb_executor = ThreadPoolExecutor(max_workers=2)
+        self._loading_paths = {"before": None, "after": None}
+        # 작업 스레드는 Tk를 직접 건드리지 않고 결과를 큐에 넣기만 한다 (메인 스레드가 after로 확인)
+        self._worker_results = queue.Queue()
+        self._worker_poll_job = None
+
         self.breeds = breeds
 
+        self.excel_log = ExcelLog(os.path.join(os.path.dirname(__file__), EXCEL_FILE))
+        # 실행할 때마다 바로 저장하지 않고 잠시 모았다가 한 번에 기록
+        # (지난 실행에서 기록하지 못하고 남은 행이 있으면 이어서 기록)
+        self._pending_rows = self.excel_log.load_pending()
+        self._flush_job = None
+        if self._pending_rows:
+            self._flush_job = self.after(EXCEL_FLUSH_DELAY_MS, self.flush_excel)
+
         self._build_ui()
         self._lock_window_size()
+        if self.excel_log.pending_set_aside:
+            self.after_idle(self._warn_pending_set_aside)
+
+        # 창을 닫을 때 남은 기록 저장
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     # ---------- UI 구성 ----------
 
@@ -242,12 +581,15 @@ class DogPhotoTool(TkinterDnD.Tk):
         row2.pack(fill="x", pady=2)
 
         ttk.Label(row2, text="고객번호(전화번호)", width=14, anchor="e").pack(side="left", padx=(0, 3))
-        self.customer_entry = ttk.Entry(row2, textvariable=self.customer_raw, width=20)
+        self.customer_entry = ttk.Entry(
+            row2,
+            textvariable=self.customer_raw,
+            width=20,
+            validate="focus",
+            validatecommand=(self.register(self._on_customer_focus_change), "%V"),
+        )
         self.customer_entry.pack(side="left")
-        self.customer_entry.insert(0, "010-0000-0000")
-        self.customer_entry.config(foreground="gray")
-        self.customer_entry.bind("<FocusIn>", self._on_customer_focus_in)
-        self.customer_entry.bind("<FocusOut>", self._on_customer_focus_out)
+        self._show_customer_placeholder()
 
         ttk.Label(row2, text="오늘 미용 스타일", width=14, anchor="e").pack(side="left", padx=(20, 3))
         ttk.Entry(row2, textvariable=self.style_today, width=20).pack(side="left")
@@ -326,8 +668,14 @@ class DogPhotoTool(TkinterDnD.Tk):
         run_btn.pack(side="right")
 
     def _lock_window_size(self):
-        """이미지 삽입 후에도 창 크기가 변하지 않도록 고정."""
-        self.update_idletasks()
+        """이미지 삽입 후에도 창 크기가 변하지 않도록 고정. (메인 루프가 첫 화면을 그린 뒤 처리)"""
+        self.after_idle(self._lock_window_size_impl)
+
+    def _lock_window_size_impl(self):
+        # 창이 아직 화면에 나타나기 전이면 실제 크기를 알 수 없으므로 잠시 후 다시 시도
+        if not self.winfo_ismapped():
+            self.after(50, self._lock_window_size_impl)
+            return
         width = self.winfo_width()
         height = self.winfo_height()
         self.minsize(width, height)
@@ -335,28 +683,39 @@ class DogPhotoTool(TkinterDnD.Tk):
 
     # ---------- 플레이스홀더 / 입력 보조 ----------
 
-    def _on_customer_focus_in(self, event):
-        if self.customer_entry.get() == "010-0000-0000" and self.customer_entry.cget("foreground") == "gray":
-            self.customer_entry.delete(0, "end")
-            self.customer_entry.config(foreground="black")
+    def _on_customer_focus_change(self, reason):
+        # validatecommand 안에서 내용을 바꾸면 Tk가 검증을 꺼버리므로 실제 변경은 idle 시점에 한다
+        if reason == "focusin" and self._placeholder_active:
+            self.after_idle(self._hide_customer_placeholder)
+        elif reason == "focusout" and not self._placeholder_active and not self.customer_raw.get().strip():
+            self.after_idle(self._show_customer_placeholder)
+        return True
 
-    def _on_customer_focus_out(self, event):
-        if not self.customer_entry.get().strip():
-            self.customer_entry.insert(0, "010-0000-0000")
-            self.customer_entry.config(foreground="gray")
+    def _show_customer_placeholder(self):
+        self.customer_entry.delete(0, "end")
+        self.customer_entry.insert(0, CUSTOMER_PLACEHOLDER)
+        self.customer_entry.config(foreground="gray")
+        self._placeholder_active = True
+
+    def _hide_customer_placeholder(self):
+        self.customer_entry.delete(0, "end")
+        self.customer_entry.config(foreground="black")
+        self._placeholder_active = False
 
     def on_payment_focus_out(self, event=None):
         raw = self.payment_display.get().strip()
-        if not raw:
+        # 이미 정리된 값 그대로면 다시 해석하지 않음 (Tab으로 지나가기만 한 경우)
+        if not raw or raw == self._payment_last:
             return
-        digits = "".join(ch for ch in raw if ch.isdigit())
+        digits = _NON_DIGIT_RE.sub("", raw)
         if not digits:
             messagebox.showerror("입력 오류", "결제금액은 숫자만 입력할 수 있습니다.", parent=self)
             self.payment_display.set("")
             return
         try:
             value = int(digits)
-            self.payment_display.set(f"{value:,}")
+            self._payment_last = f"{value:,}"
+            self.payment_display.set(self._payment_last)
         except ValueError:
             messagebox.showerror("입력 오류", "결제금액을 해석할 수 없습니다.", parent=self)
             self.payment_display.set("")
@@ -382,43 +741,13 @@ class DogPhotoTool(TkinterDnD.Tk):
             self.set_photo(which, path)
 
     def on_photo_drop(self, event, which: str):
-        # DND_FILES는 여러 개일 수 있음. 첫 번째만 사용.
-        data = event.data
-        if " " in data and not (data.startswith("{") and data.endswith("}")):
-            # 공백 포함 경로 처리용
-            parts = self.split_dnd_files(data)
-        else:
-            parts = [data.strip("{}")]
-
+        # DND_FILES는 Tcl 리스트 형식(공백 포함 경로는 {})이고 여러 개일 수 있음. 첫 번째만 사용.
+        parts = self.tk.splitlist(event.data)
         if not parts:
             return
         path = parts[0]
         self.set_photo(which, path)
 
-    @staticmethod
-    def split_dnd_files(data: str):
-        # {C:\path with space\file.jpg} C:\path2\file2.jpg
-        result = []
-        current = ""
-        in_brace = False
-        for ch in data:
-            if ch == "{":
-                in_brace = True
-                current = ""
-            elif ch == "}":
-                in_brace = False
-                result.append(current)
-                current = ""
-            elif ch == " " and not in_brace:
-                if current:
-                    result.append(current)
-                    current = ""
-            else:
-                current += ch
-        if current:
-            result.append(current)
-        return result
-
     def set_photo(self, which: str, path: str):
         if not os.path.isfile(path):
             messagebox.showerror("파일 오류", "파일을 찾을 수 없습니다.", parent=self)
@@ -429,26 +758,74 @@ class DogPhotoTool(TkinterDnD.Tk):
             messagebox.showerror("파일 오류", "JPG, JPEG, PNG 형식만 사용할 수 있습니다.", parent=self)
             return
 
+        label = self.before_label if which == "before" else self.after_label
+        label.config(image="", text="로딩 중...")
+
+        # 디코딩이 끝나기 전에 다른 사진이 선택되면 이전 결과는 버린다
+        self._loading_paths[which] = path
+        self._submit_to_worker(load_image_for_thumbnail, self._on_thumbnail_loaded, which, path)
+
+    def _submit_to_worker(self, func, handler, which: str, path: str):
+        """func(path)를 작업 스레드에서 실행하고, 끝나면 메인 스레드에서 handler(which, path, future) 호출."""
+        future = self._thumb_executor.submit(func, path)
+        future.add_done_callback(lambda f: self._worker_results.put((handler, which, path, f)))
+        if self._worker_poll_job is None:
+            self._worker_poll_job = self.after(WORKER_POLL_MS, self._poll_worker_results)
+
+    def _poll_worker_results(self):
+        self._worker_poll_job = None
+        while True:
+            try:
+                handler, which, path, future = self._worker_results.get_nowait()
+            except queue.Empty:
+                break
+            handler(which, path, future)
+
+        # 아직 불러오는 사진이 있으면 계속 확인
+        if any(self._loading_paths.values()) or not self._worker_results.empty():
+            self._worker_poll_job = self.after(WORKER_POLL_MS, self._poll_worker_results)
+
+    def _on_thumbnail_loaded(self, which: str, path: str, future):
+        """작업 스레드의 디코딩 결과를 메인 스레드에서 화면에 반영."""
+        if self._loading_paths[which] != path:
+            return
+        self._loading_paths[which] = None
+
+        if which == "before":
+            label, old_thumb, default_text = self.before_label, self.before_thumb, "미용 전 사진\n(여기로 드롭 또는 클릭)"
+        else:
+            label, old_thumb, default_text = self.after_label, self.after_thumb, "미용 후 사진\n(여기로 드롭 또는 클릭)"
+
+        from PIL import ImageTk
+
         try:
-            thumb = load_image_for_thumbnail(path)
+            thumb = ImageTk.PhotoImage(future.result())
         except Exception as e:
+            # 기존에 선택된 사진이 있으면 그대로 유지
+            if old_thumb is not None:
+                label.config(image=old_thumb, text="")
+            else:
+                label.config(image="", text=default_text)
             messagebox.showerror("이미지 오류", f"이미지를 불러오는 중 오류가 발생했습니다.\n\n{e}", parent=self)
             return
 
         if which == "before":
             self.before_path.set(path)
             self.before_thumb = thumb
-            self.before_label.config(image=self.before_thumb, text="")
         else:
             self.after_path.set(path)
             self.after_thumb = thumb
-            self.after_label.config(image=self.after_thumb, text="")
+        label.config(image=thumb, text="")
 
     # ---------- 실행 ----------
 
     def on_run(self):
         try:
             # 1. 기본 입력 검증
+            if any(self._loading_paths.values()):
+                messagebox.showinfo("잠시만요", "사진을 불러오는 중입니다. 미리보기가 나타난 뒤 다시 실행해주세요.", parent=self)
+                return
+
             before = self.before_path.get()
             after = self.after_path.get()
 
@@ -458,20 +835,18 @@ class DogPhotoTool(TkinterDnD.Tk):
 
             dog_name = self.dog_name.get().strip()
             owner_name = self.owner_name.get().strip()
-            raw_customer = self.customer_raw.get().strip()
-            if raw_customer == "010-0000-0000" and self.customer_entry.cget("foreground") == "gray":
-                raw_customer = ""
+            raw_customer = "" if self._placeholder_active else self.customer_raw.get().strip()
 
             if not dog_name or not owner_name or not raw_customer:
                 messagebox.showerror("입력 오류", "강아지 이름, 보호자 이름, 고객번호를 모두 입력해주세요.", parent=self)
                 return
 
             # 고객번호: 숫자만 추출, 나머지 문자 있으면 경고
-            digits_only = "".join(ch for ch in raw_customer if ch.isdigit())
+            digits_only = _NON_DIGIT_RE.sub("", raw_customer)
             if not digits_only:
                 messagebox.showerror("입력 오류", "고객번호는 숫자를 포함해야 합니다.", parent=self)
                 return
-            if any(not (ch.isdigit() or ch in "- ") for ch in raw_customer):
+            if _PHONE_INVALID_RE.search(raw_customer):
                 messagebox.showerror("입력 오류", "고객번호에는 숫자와 '-'만 사용해주세요.", parent=self)
                 return
             customer_no = digits_only
@@ -489,7 +864,7 @@ class DogPhotoTool(TkinterDnD.Tk):
             # 결제금액
             raw_pay = self.payment_display.get().strip()
             if raw_pay:
-                digits = "".join(ch for ch in raw_pay if ch.isdigit())
+                digits = _NON_DIGIT_RE.sub("", raw_pay)
                 if not digits:
                     messagebox.showerror("입력 오류", "결제금액은 숫자만 입력할 수 있습니다.", parent=self)
                     return
@@ -538,7 +913,7 @@ class DogPhotoTool(TkinterDnD.Tk):
             dest_before = os.path.join(dest_folder, name_before)
             dest_after = os.path.join(dest_folder, name_after)
 
-            # 3. 파일 복사 (PIL로 다시 저장 → 형식 깨끗하게)
+            # 3. 파일 복사 (필요할 때만 PIL로 다시 저장 → 형식 깨끗하게)
             self.save_image_copy(before, dest_before)
             self.save_image_copy(after, dest_after)
 
@@ -560,12 +935,14 @@ class DogPhotoTool(TkinterDnD.Tk):
                 os.path.basename(dest_before),
                 os.path.basename(dest_after),
             ]
-            append_excel_row(os.path.join(os.path.dirname(__file__), EXCEL_FILE), row)
+            self.queue_excel_row(row)
 
             # 5. 성공 메시지 & 입력 초기화
             messagebox.showinfo(
                 "완료",
-                f"사진과 기록이 저장되었습니다.\n\n폴더 위치:\n{dest_folder}",
+                "사진이 저장되었습니다.\n"
+                "고객 기록은 잠시 후 엑셀 파일에 추가됩니다.\n\n"
+                f"폴더 위치:\n{dest_folder}",
                 parent=self,
             )
 
@@ -575,22 +952,123 @@ class DogPhotoTool(TkinterDnD.Tk):
             err_text = traceback.format_exc()
             self.show_unexpected_error(err_text)
 
+    def _warn_pending_set_aside(self):
+        messagebox.showwarning(
+            "보관된 기록을 읽지 못함",
+            "지난 실행에서 엑셀에 기록하지 못하고 보관해 둔 고객 기록 파일을 읽을 수 없어 건너뛰었습니다.\n"
+            "필요하면 아래 파일을 열어 내용을 확인해주세요.\n\n"
+            f"{self.excel_log.pending_set_aside}",
+            parent=self,
+        )
+
+    def queue_excel_row(self, row):
+        """
+        엑셀에 기록할 행을 모아 두고, 잠시 후 한 번에 저장하도록 예약.
+        모아 둔 행은 바로 별도 파일에도 보관해서 프로그램이 갑자기 종료되어도 잃어버리지 않는다.
+        """
+        self._pending_rows.append(tuple(row))
+        self.excel_log.save_pending(self._pending_rows)
+        if self._flush_job is None:
+            self._flush_job = self.after(EXCEL_FLUSH_DELAY_MS, self.flush_excel)
+
+    def flush_excel(self) -> bool:
+        """
+        모아 둔 행을 한 번에 엑셀에 기록.
+        실패하면 행을 남겨 두고 안내한 뒤 False를 반환한다. 파일이 열려 있는 등 일시적인 오류(OSError)면
+        EXCEL_RETRY_DELAY_MS 후 다시 시도하고, 그 밖의 오류는 다음 기록을 추가하거나 창을 닫을 때 다시 시도한다.
+        """
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        if not self._pending_rows:
+            return True
+
+        try:
+            self.excel_log.append_rows(self._pending_rows)
+        except Exception as e:
+            transient = isinstance(e, OSError)
+            if isinstance(e, PermissionError):
+                reason = "엑셀 파일이 다른 프로그램(엑셀 등)에서 열려 있다면 닫아주세요."
+            else:
+                reason = f"{type(e).__name__}: {e}"
+            if transient:
+                retry = f"{EXCEL_RETRY_DELAY_MS // 1000}초 후 자동으로 다시 시도합니다."
+            else:
+                retry = "다음 고객을 기록하거나 프로그램을 닫을 때 다시 시도합니다."
+            messagebox.showerror(
+                "엑셀 기록 실패",
+                f"고객 기록 {len(self._pending_rows)}건을 엑셀 파일에 추가하지 못했습니다.\n\n"
+                f"{reason}\n\n"
+                f"기록은 보관되어 있으며 {retry}",
+                parent=self,
+            )
+            # 안내창이 떠 있는 동안 새 기록이 예약됐을 수 있으므로 비어 있을 때만 예약
+            if transient and self._flush_job is None:
+                self._flush_job = self.after(EXCEL_RETRY_DELAY_MS, self.flush_excel)
+            return False
+
+        # 엑셀에는 이미 기록됐으므로 보관 파일 정리에 실패해도 성공으로 처리 (예외를 after 밖으로 내보내지 않음)
+        self._pending_rows.clear()
+        try:
+            self.excel_log.clear_pending()
+        except OSError as e:
+            messagebox.showwarning(
+                "보관 파일 정리 실패",
+                "고객 기록은 엑셀 파일에 추가되었지만 보관 파일을 지우지 못했습니다.\n"
+                "다음 실행 때 같은 기록이 다시 추가되지 않도록 아래 파일을 직접 지워주세요.\n\n"
+                f"{self.excel_log.pending_path}\n\n{type(e).__name__}: {e}",
+                parent=self,
+            )
+        return True
+
+    def on_close(self):
+        if not self.flush_excel():
+            answer = messagebox.askyesno(
+                "저장 실패",
+                f"엑셀에 기록되지 않은 고객 기록이 {len(self._pending_rows)}건 있습니다.\n"
+                "지금 종료해도 기록은 보관되었다가 다음 실행 때 다시 저장됩니다.\n\n"
+                "종료할까요?",
+                parent=self,
+            )
+            if not answer:
+                return
+
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        if self._worker_poll_job is not None:
+            self.after_cancel(self._worker_poll_job)
+            self._worker_poll_job = None
+        self._thumb_executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
     def save_image_copy(self, src, dest):
-        """원본 이미지를 다시 열어 JPEG/PNG로 깨끗하게 저장."""
-        im = Image.open(src)
+        """
+        원본 이미지를 JPEG/PNG로 깨끗하게 저장.
+        원본이 이미 저장할 형식이고 변환할 것이 없으면 다시 인코딩하지 않고 파일을 그대로 복사한다.
+        판단은 썸네일을 만들 때 기록한 헤더 정보로 하고, 픽셀은 다시 인코딩할 때만 디코딩한다.
+        """
+        header = read_image_header(src)
         ext = os.path.splitext(dest)[1].lower()
-        if im.mode in ("RGBA", "LA"):
-            bg = Image.new("RGB", im.size, (255, 255, 255))
-            alpha = im.split()[-1]
-            bg.paste(im, mask=alpha)
-            im = bg
-        else:
-            im = im.convert("RGB")
+        target_format = "JPEG" if ext in (".jpg", ".jpeg") else "PNG"
+
+        if (
+            header.format == target_format
+            and header.mode in ("RGB", "L")
+            and not header.has_transparency
+            and header.orientation == 1
+        ):
+            shutil.copyfile(src, dest)
+            return
 
-        if ext in (".jpg", ".jpeg"):
-            im.save(dest, format="JPEG", quality=95)
+        with Image.open(src) as im:
+            im.load()
+            out = flatten_to_rgb(apply_exif_orientation(im))
+
+        if target_format == "JPEG":
+            out.save(dest, format="JPEG", quality=95)
         else:
-            im.save(dest, format="PNG")
+            out.save(dest, format="PNG")
 
     def reset_inputs(self):
         """성공 후 입력 초기화."""
@@ -599,15 +1077,14 @@ class DogPhotoTool(TkinterDnD.Tk):
         self.after_path.set("")
         self.before_thumb = None
         self.after_thumb = None
+        self._loading_paths = {"before": None, "after": None}
+        clear_image_header_cache()
         self.before_label.config(image="", text="미용 전 사진\n(여기로 드롭 또는 클릭)")
         self.after_label.config(image="", text="미용 후 사진\n(여기로 드롭 또는 클릭)")
 
         self.dog_name.set("")
         self.owner_name.set("")
-        self.customer_raw.set("")
-        self.customer_entry.delete(0, "end")
-        self.customer_entry.insert(0, "010-0000-0000")
-        self.customer_entry.config(foreground="gray")
+        self._show_customer_placeholder()
 
         self.style_today.set("")
         self.breed_var.set(self.breeds[0] if self.breeds else "")
@@ -615,6 +1092,7 @@ class DogPhotoTool(TkinterDnD.Tk):
         self.breed_other_entry.config(state="disabled")
 
         self.payment_display.set("")
+        self._payment_last = None
         self.payment_state.set("paid")
 
         self.requirements_text.delete("1.0", "end")
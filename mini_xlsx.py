@@ -0,0 +1,305 @@
+"""
+openpyxl 없이 시트 하나짜리 XLSX 파일을 읽고 쓰는 최소 구현.
+
+고객 기록처럼 스타일/수식 없이 값만 들어 있는 표 전용이다. (그 밖의 파일은 read_rows가 거절)
+고정된 부분(_rels, workbook.xml, styles.xml, [Content_Types].xml)은 미리 만든 바이트를 그대로 쓰고,
+행은 추가될 때 한 번만 <row> XML로 직렬화해 두었다가 저장할 때 이어 붙이기만 한다.
+"""
+
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_XML_DECL = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_CONTENT_TYPES = _XML_DECL + (
+    b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    b'<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    b'<Default Extension="xml" ContentType="application/xml"/>'
+    b'<Override PartName="/xl/workbook.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    b'<Override PartName="/xl/worksheets/sheet1.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    b'<Override PartName="/xl/styles.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    b"</Types>"
+)
+
+_ROOT_RELS = _XML_DECL + (
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    b'Target="xl/workbook.xml"/>'
+    b"</Relationships>"
+)
+
+_WORKBOOK_RELS = _XML_DECL + (
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    b'Target="worksheets/sheet1.xml"/>'
+    b'<Relationship Id="rId2" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    b'Target="styles.xml"/>'
+    b"</Relationships>"
+)
+
+_STYLES = _XML_DECL + (
+    b'<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    b'<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    b'<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    b'<fill><patternFill patternType="gray125"/></fill></fills>'
+    b'<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    b'<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    b'<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    b'<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    b"</styleSheet>"
+)
+
+_SHEET_HEAD = _XML_DECL + (
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = b"</sheetData></worksheet>"
+
+# XML 1.0에서 쓸 수 없는 제어 문자 (탭/줄바꿈 제외)
+_ILLEGAL_XML_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_CELL_REF_RE = re.compile(r"([A-Z]+)")
+
+
+def _column_letter(index: int) -> str:
+    """0부터 시작하는 열 번호를 엑셀 열 이름(A, B, ..., AA)으로 변환."""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def _column_index(ref: str) -> int:
+    """셀 주소(예: 'AB12')의 열 부분을 0부터 시작하는 번호로 변환."""
+    index = 0
+    for ch in _CELL_REF_RE.match(ref).group(1):
+        index = index * 26 + (ord(ch) - ord("A") + 1)
+    return index - 1
+
+
+def _cell_xml(ref: str, value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    text = escape(_ILLEGAL_XML_CHARS_RE.sub("", str(value)))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+class MiniXlsx:
+    """값만 들어 있는 단일 시트 XLSX. 행은 추가 순서대로 1행부터 채워진다."""
+
+    def __init__(self, sheet_title: str = "Sheet1"):
+        self.sheet_title = sheet_title
+        self._row_xml = []
+        self._workbook_xml = _XML_DECL + (
+            f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+            f"<sheets><sheet name={quoteattr(sheet_title)} sheetId=\"1\" r:id=\"rId1\"/></sheets>"
+            "</workbook>"
+        ).encode("utf-8")
+
+    def __len__(self):
+        return len(self._row_xml)
+
+    def append(self, values):
+        row_no = len(self._row_xml) + 1
+        cells = "".join(
+            _cell_xml(f"{_column_letter(col)}{row_no}", value) for col, value in enumerate(values)
+        )
+        self._row_xml.append(f'<row r="{row_no}">{cells}</row>'.encode("utf-8"))
+
+    def truncate(self, count: int):
+        """앞에서부터 count개의 행만 남긴다."""
+        del self._row_xml[count:]
+
+    def save(self, path: str):
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("[Content_Types].xml", _CONTENT_TYPES)
+            zf.writestr("_rels/.rels", _ROOT_RELS)
+            zf.writestr("xl/workbook.xml", self._workbook_xml)
+            zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+            zf.writestr("xl/styles.xml", _STYLES)
+            zf.writestr("xl/worksheets/sheet1.xml", _SHEET_HEAD + b"".join(self._row_xml) + _SHEET_TAIL)
+
+
+# ---------- 읽기 (기존 파일 불러오기용) ----------
+
+class UnsupportedWorkbookError(Exception):
+    """값만 다시 써서는 보존할 수 없는 내용(다른 시트, 수식, 서식 등)이 들어 있는 파일."""
+
+
+def _tag(name: str) -> str:
+    return f"{{{_MAIN_NS}}}{name}"
+
+
+# 값만 다시 써도 잃어버리는 데이터가 없는 시트 구성 요소
+# (phoneticPr: 한국어/일본어 엑셀이 저장할 때마다 넣는 윗주 설정, 나머지는 화면/인쇄 설정)
+_PLAIN_SHEET_ELEMENTS = {
+    _tag("sheetPr"),
+    _tag("dimension"),
+    _tag("sheetViews"),
+    _tag("sheetFormatPr"),
+    _tag("sheetData"),
+    _tag("phoneticPr"),
+    _tag("printOptions"),
+    _tag("pageMargins"),
+    _tag("pageSetup"),
+    _tag("headerFooter"),
+}
+_PLAIN_SHEET_PR_ELEMENTS = {_tag("outlinePr"), _tag("pageSetUpPr")}
+_PLAIN_CELL_TYPES = {"s", "inlineStr", "n", "b"}
+
+# 보존할 수 없는 시트 구성 요소 → 오류 메시지에 보여줄 이름
+_SHEET_ELEMENT_NAMES = {
+    _tag("cols"): "열 너비/열 서식",
+    _tag("mergeCells"): "셀 병합",
+    _tag("conditionalFormatting"): "조건부 서식",
+    _tag("dataValidations"): "데이터 유효성 검사",
+    _tag("hyperlinks"): "하이퍼링크",
+    _tag("autoFilter"): "필터",
+    _tag("drawing"): "그림/차트",
+    _tag("legacyDrawing"): "메모",
+}
+
+
+def _sheet_entries(zf: zipfile.ZipFile):
+    """workbook.xml의 시트 목록 (이름, zip 내부 경로). 파일 구조를 알 수 없으면 sheet1.xml 하나로 본다."""
+    try:
+        workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+        rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    except KeyError:
+        return [(None, "xl/worksheets/sheet1.xml")]
+
+    targets = {}
+    for rel in rels.iter(f"{{{_PKG_REL_NS}}}Relationship"):
+        target = rel.get("Target", "")
+        targets[rel.get("Id")] = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+
+    entries = [
+        (sheet.get("name"), targets.get(sheet.get(f"{{{_REL_NS}}}id"), "xl/worksheets/sheet1.xml"))
+        for sheet in workbook.iter(_tag("sheet"))
+    ]
+    return entries or [(None, "xl/worksheets/sheet1.xml")]
+
+
+def _rich_text(element) -> str:
+    """<si>/<is> 안의 텍스트 (서식 run 포함, 윗주 rPh 제외)."""
+    parts = []
+    for child in element:
+        if child.tag == _tag("t"):
+            parts.append(child.text or "")
+        elif child.tag == _tag("r"):
+            parts.extend(t.text or "" for t in child.iter(_tag("t")))
+    return "".join(parts)
+
+
+def _read_shared_strings(zf: zipfile.ZipFile, problems):
+    try:
+        root = ET.fromstring(zf.read("xl/sharedStrings.xml"))
+    except KeyError:
+        return []
+    strings = []
+    for si in root.iter(_tag("si")):
+        if si.find(_tag("r")) is not None:
+            problems.add("글자 서식")
+        strings.append(_rich_text(si))
+    return strings
+
+
+def _check_sheet_structure(sheet, problems):
+    for child in sheet:
+        if child.tag not in _PLAIN_SHEET_ELEMENTS:
+            problems.add(_SHEET_ELEMENT_NAMES.get(child.tag, child.tag.rpartition("}")[2]))
+        elif child.tag == _tag("sheetPr"):
+            if any(pr.tag not in _PLAIN_SHEET_PR_ELEMENTS for pr in child):
+                problems.add("시트 속성(탭 색 등)")
+        elif child.tag == _tag("sheetViews"):
+            if child.find(f"{_tag('sheetView')}/{_tag('pane')}") is not None:
+                problems.add("틀 고정")
+
+
+def _parse_number(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _cell_value(cell, shared_strings):
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        inline = cell.find(_tag("is"))
+        return _rich_text(inline) if inline is not None else ""
+
+    v = cell.find(_tag("v"))
+    if v is None or v.text is None:
+        return None
+    if cell_type == "s":
+        return shared_strings[int(v.text)]
+    if cell_type == "b":
+        return v.text == "1"
+    return _parse_number(v.text)
+
+
+def read_rows(path: str):
+    """
+    XLSX 파일 첫 번째 시트의 값을 행 단위 튜플 목록으로 읽는다. (완전히 빈 행은 건너뜀)
+
+    이 모듈은 값만 다시 쓰므로, 다시 쓰면 사라질 내용(다른 시트, 수식, 셀/행 서식, 열 너비,
+    날짜 등 서식이 있어야 의미가 있는 값 …)이 있으면 UnsupportedWorkbookError를 발생시킨다.
+    이 모듈이나 openpyxl로 만든 파일, 엑셀에서 값만 고쳐 저장한 파일은 읽을 수 있지만,
+    엑셀/LibreOffice에서 열 너비나 서식을 바꾼 파일은 대부분 UnsupportedWorkbookError가 된다.
+    (호출하는 쪽에서 openpyxl 등 모든 내용을 보존하는 방식으로 처리할 것)
+    """
+    problems = set()
+    with zipfile.ZipFile(path) as zf:
+        entries = _sheet_entries(zf)
+        if len(entries) > 1:
+            problems.add(f"시트 {len(entries)}개 ({', '.join(name or '?' for name, _ in entries)})")
+        shared_strings = _read_shared_strings(zf, problems)
+        sheet = ET.fromstring(zf.read(entries[0][1]))
+
+    _check_sheet_structure(sheet, problems)
+
+    rows = []
+    for row in sheet.iter(_tag("row")):
+        if row.get("customFormat") in ("1", "true") or row.get("customHeight") in ("1", "true") \
+                or row.get("hidden") in ("1", "true"):
+            problems.add("행 높이/행 서식")
+        values = {}
+        next_col = 0
+        for cell in row.iter(_tag("c")):
+            if cell.find(_tag("f")) is not None:
+                problems.add("수식")
+            if cell.get("s") not in (None, "0"):
+                problems.add("셀 서식(날짜 형식 포함)")
+            if cell.get("t", "n") not in _PLAIN_CELL_TYPES:
+                problems.add(f"지원하지 않는 값 형식({cell.get('t')})")
+                continue
+
+            ref = cell.get("r")
+            col = _column_index(ref) if ref else next_col
+            next_col = col + 1
+            value = _cell_value(cell, shared_strings)
+            if value is not None:
+                values[col] = value
+        if values:
+            rows.append(tuple(values.get(col) for col in range(max(values) + 1)))
+
+    if problems:
+        raise UnsupportedWorkbookError(", ".join(sorted(problems)))
+    return rows
@@ -0,0 +1,80 @@
+import datetime
+import os
+
+import openpyxl
+
+from main import EXCEL_HEADER, ExcelLog
+from mini_xlsx import read_rows
+
+ROW = ("2024-05-01", "김철수", "01012345678", "말티즈", "")
+
+
+def test_creates_file_with_header(tmp_path):
+    path = tmp_path / "customer_data.xlsx"
+    log = ExcelLog(str(path))
+    log.append_rows([ROW, ROW])
+
+    assert read_rows(str(path)) == [EXCEL_HEADER, ROW, ROW]
+    assert not (tmp_path / "customer_data.xlsx.bak").exists()
+
+
+def test_keeps_content_of_edited_workbook(tmp_path):
+    path = tmp_path / "customer_data.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(EXCEL_HEADER)
+    ws.column_dimensions["B"].width = 30
+    ws["F1"] = "=1+1"
+    ws["G1"] = datetime.date(2024, 5, 1)
+    wb.create_sheet("메모")["A1"] = "따로 적어 둔 내용"
+    wb.save(path)
+
+    log = ExcelLog(str(path))
+    log.append_rows([ROW])
+    log.append_rows([ROW])
+
+    wb = openpyxl.load_workbook(path)
+    ws = wb.worksheets[0]
+    assert ws.column_dimensions["B"].width == 30
+    assert ws["F1"].value == "=1+1"
+    assert ws["G1"].value == datetime.datetime(2024, 5, 1)
+    assert wb["메모"]["A1"].value == "따로 적어 둔 내용"
+    assert [row[:4] for row in ws.iter_rows(min_row=2, values_only=True)] == [ROW[:4], ROW[:4]]
+    assert (tmp_path / "customer_data.xlsx.bak").exists()
+    assert not (tmp_path / "customer_data.xlsx.tmp").exists()
+
+
+def test_pending_round_trip(tmp_path):
+    log = ExcelLog(str(tmp_path / "customer_data.xlsx"))
+    assert log.load_pending() == []
+
+    log.save_pending([ROW])
+    assert log.load_pending() == [ROW]
+
+    log.clear_pending()
+    assert log.load_pending() == []
+    assert log.pending_set_aside is None
+
+
+def test_corrupt_pending_is_set_aside(tmp_path):
+    log = ExcelLog(str(tmp_path / "customer_data.xlsx"))
+    with open(log.pending_path, "w", encoding="utf-8") as f:
+        f.write('[["2024-05-01", "김철')
+
+    assert log.load_pending() == []
+    assert log.pending_set_aside == log.pending_path + ".corrupt"
+    assert not os.path.exists(log.pending_path)
+    assert os.path.exists(log.pending_set_aside)
+
+
+def test_clear_pending_truncates_when_remove_fails(tmp_path, monkeypatch):
+    log = ExcelLog(str(tmp_path / "customer_data.xlsx"))
+    log.save_pending([ROW])
+
+    def locked(path):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(os, "remove", locked)
+    log.clear_pending()
+
+    assert log.load_pending() == []
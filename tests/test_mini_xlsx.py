@@ -0,0 +1,158 @@
+import zipfile
+
+import openpyxl
+import pytest
+from openpyxl.styles import Font
+
+from mini_xlsx import MiniXlsx, UnsupportedWorkbookError, read_rows
+
+ROWS = [
+    ("날짜", "이름", "전화번호", "견종", "메모"),
+    ("2024-05-01", "김철수", "01012345678", "말티즈", ""),
+    ("2024-05-02", "이영희", "01098765432", "푸들", 3),
+]
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets></workbook>'
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{rels}'
+    '<Relationship Id="rIdS" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+    'sharedStrings" Target="sharedStrings.xml"/></Relationships>'
+)
+_SHARED_STRINGS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="3" uniqueCount="3">'
+    '<si><t>이름</t><phoneticPr fontId="1" type="noConversion"/></si>'
+    '<si><t>김철수</t><rPh sb="0" eb="3"><t>キム</t></rPh><phoneticPr fontId="1" type="noConversion"/></si>'
+    '<si><t xml:space="preserve"> 말티즈 </t><phoneticPr fontId="1" type="noConversion"/></si>'
+    '</sst>'
+)
+# 한국어 엑셀이 저장한 파일 모양 (x14ac 속성, 행 spans, 윗주/인쇄 설정)
+_EXCEL_SHEET = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:x14ac="http://schemas.microsoft.com/office/spreadsheetml/2009/9/ac" mc:Ignorable="x14ac">'
+    '<dimension ref="A1:C2"/>'
+    '<sheetViews><sheetView tabSelected="1" workbookViewId="0"><selection activeCell="A1" sqref="A1"/>'
+    '</sheetView></sheetViews>'
+    '<sheetFormatPr defaultRowHeight="16.5" x14ac:dyDescent="0.3"/>'
+    '<sheetData>'
+    '<row r="1" spans="1:3" x14ac:dyDescent="0.3"><c r="A1" t="s"><v>0</v></c><c r="C1"><v>1.5</v></c></row>'
+    '<row r="2" spans="1:3" x14ac:dyDescent="0.3"><c r="A2" t="s"><v>1</v></c><c r="B2" t="s"><v>2</v></c>'
+    '<c r="C2" t="b"><v>1</v></c></row>'
+    '</sheetData>'
+    '<phoneticPr fontId="1" type="noConversion"/>'
+    '<printOptions gridLines="0"/>'
+    '<pageMargins left="0.7" right="0.7" top="0.75" bottom="0.75" header="0.3" footer="0.3"/>'
+    '<pageSetup paperSize="9" orientation="portrait"/>'
+    '<headerFooter/>'
+    '</worksheet>'
+)
+
+
+def _write_excel_shaped(path, sheet_xml=_EXCEL_SHEET, sheet_names=("Sheet1",)):
+    sheets = "".join(
+        f'<sheet name="{name}" sheetId="{i}" r:id="rId{i}"/>' for i, name in enumerate(sheet_names, 1)
+    )
+    rels = "".join(
+        f'<Relationship Id="rId{i}" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+        f'relationships/worksheet" Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, len(sheet_names) + 1)
+    )
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("xl/workbook.xml", _WORKBOOK.format(sheets=sheets))
+        zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS.format(rels=rels))
+        zf.writestr("xl/sharedStrings.xml", _SHARED_STRINGS)
+        for i in range(1, len(sheet_names) + 1):
+            zf.writestr(f"xl/worksheets/sheet{i}.xml", sheet_xml)
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "log.xlsx"
+    sheet = MiniXlsx("고객기록")
+    for row in ROWS:
+        sheet.append(row)
+    sheet.save(str(path))
+
+    assert read_rows(str(path)) == ROWS
+    assert list(openpyxl.load_workbook(path).active.iter_rows(values_only=True)) == ROWS
+
+
+def test_truncate(tmp_path):
+    path = tmp_path / "log.xlsx"
+    sheet = MiniXlsx("고객기록")
+    for row in ROWS:
+        sheet.append(row)
+    sheet.truncate(1)
+    sheet.save(str(path))
+
+    assert len(sheet) == 1
+    assert read_rows(str(path)) == ROWS[:1]
+
+
+def test_reads_openpyxl_file(tmp_path):
+    path = tmp_path / "log.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "고객기록"
+    for row in ROWS:
+        ws.append(row)
+    wb.save(path)
+
+    assert read_rows(str(path)) == ROWS
+
+
+def test_reads_excel_shaped_file(tmp_path):
+    path = tmp_path / "log.xlsx"
+    _write_excel_shaped(path)
+
+    assert read_rows(str(path)) == [("이름", None, 1.5), ("김철수", " 말티즈 ", True)]
+
+
+@pytest.mark.parametrize(
+    "sheet_xml, problem",
+    [
+        (_EXCEL_SHEET.replace('<c r="C1"><v>1.5</v></c>', '<c r="C1"><f>1+1</f><v>2</v></c>'), "수식"),
+        (_EXCEL_SHEET.replace('<c r="C1">', '<c r="C1" s="1">'), "셀 서식"),
+        (_EXCEL_SHEET.replace("<sheetData>", '<cols><col min="1" max="1" width="20" customWidth="1"/></cols>'
+                                             "<sheetData>"), "열 너비"),
+        (_EXCEL_SHEET.replace('<row r="1" spans="1:3"', '<row r="1" spans="1:3" ht="30" customHeight="1"'),
+         "행 높이"),
+        (_EXCEL_SHEET.replace('<selection activeCell="A1" sqref="A1"/>',
+                              '<pane ySplit="1" topLeftCell="A2" state="frozen"/>'), "틀 고정"),
+    ],
+)
+def test_rejects_content_that_rewrite_would_drop(tmp_path, sheet_xml, problem):
+    path = tmp_path / "log.xlsx"
+    _write_excel_shaped(path, sheet_xml)
+
+    with pytest.raises(UnsupportedWorkbookError, match=problem):
+        read_rows(str(path))
+
+
+def test_rejects_second_sheet(tmp_path):
+    path = tmp_path / "log.xlsx"
+    _write_excel_shaped(path, sheet_names=("고객기록", "메모"))
+
+    with pytest.raises(UnsupportedWorkbookError, match="시트 2개"):
+        read_rows(str(path))
+
+
+def test_rejects_openpyxl_styles(tmp_path):
+    path = tmp_path / "log.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(ROWS[0])
+    ws["A1"].font = Font(bold=True)
+    ws.column_dimensions["B"].width = 30
+    wb.save(path)
+
+    with pytest.raises(UnsupportedWorkbookError):
+        read_rows(str(path))